@@ -319,7 +319,7 @@ def getResults(trackerdict, cumulativesky=False):
     import pandas as pd
     from pandas import DataFrame as df
     
-    results = pd.DataFrame(None)
+    rows = []
     
     def _printRow(analysisobj, key):
         if cumulativesky:
@@ -337,13 +337,14 @@ def getResults(trackerdict, cumulativesky=False):
                                       index=[0])
                 
             for analysis in trackerdict[key]['AnalysisObj']:
-                results = pd.concat([results, 
-                                     pd.concat([_printRow(analysis, key),data_extra], axis=1)
-                                     ], ignore_index=True)
+                row = pd.concat([_printRow(analysis, key),data_extra], axis=1)
+                rows.append(row.loc[:,~row.columns.duplicated()])
         except KeyError:
             pass
     
-    return results.loc[:,~results.columns.duplicated()]
+    if not rows:
+        return pd.DataFrame(None)
+    return pd.concat(rows, ignore_index=True)
 
 def _exportTrackerDict(trackerdict, savefile, cumulativesky=False, reindex=False, monthlyyearly=False):
     """
@@ -418,8 +419,7 @@ def _exportTrackerDict(trackerdict, savefile, cumulativesky=False, reindex=False
                             # Subhourly to hourly data averages, doesn't sum
                             # So we get average hourly irradiance as well as Wh on 
                             # results of power.
-                            D2b = D2.copy()
-                            D2b = D2b.groupby(pd.PeriodIndex(D2b.index, freq="h")).mean(numeric_only=True).reset_index()
+                            D2b = D2.groupby(pd.PeriodIndex(D2.index, freq="h")).mean(numeric_only=True).reset_index()
                             D2b['BGG'] = D2b['Grear_mean']*100/D2b['Gfront_mean']
                             D2b['BGE'] = (D2b['Pout']-D2b['Pout_Gfront'])*100/D2b['Pout']
                             D2b['Mismatch'] = (D2b['Pout_raw']-D2b['Pout'])*100/D2b['Pout_raw']
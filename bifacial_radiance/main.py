@@ -66,6 +66,8 @@ LOGGER.setLevel(logging.DEBUG)
 global DATA_PATH # path to data files including module.json.  Global context
 DATA_PATH = os.path.abspath(os.path.join(os.path.dirname(__file__), 'data'))
 
+_EPW_INDEX_CACHE = {}  # EnergyPlus weather file index, downloaded once per session
+
 def _findme(lst, a): #find string match in a list. script from stackexchange
     return [i for i, x in enumerate(lst) if x == a]
 
@@ -162,7 +164,7 @@ def _modDict(originaldict, moddict, relative=False):
                 newdict[key] = moddict[key] + newdict[key]
             else:
                 newdict[key] = moddict[key]
-        except:
+        except (KeyError, TypeError):
             print("Wrong key in modified dictionary")
 
     return newdict
@@ -463,25 +465,23 @@ class RadianceObj(SuperClass):
             raise(exc)
 
         # check for path in the new Radiance directory:
-        def _checkPath(path):  # create the file structure if it doesn't exist
-            if not os.path.exists(path):
-                os.makedirs(path)
-                print('Making path: '+path)
-
-        _checkPath('images'); _checkPath('objects')
-        _checkPath('results'); _checkPath('skies'); _checkPath('EPWs')
+        # exist_ok avoids a race when several hpc workers share one path.
+        for folder in ('images', 'objects', 'results', 'skies', 'EPWs'):
+            if not os.path.isdir(folder):
+                os.makedirs(folder, exist_ok=True)
+                print('Making path: '+folder)
         # if materials directory doesn't exist, populate it with ground.rad
         # figure out where pip installed support files.
         from shutil import copy2
 
-        if not os.path.exists('materials'):  #copy ground.rad to /materials
-            os.makedirs('materials')
+        if not os.path.isdir('materials'):  #copy ground.rad to /materials
+            os.makedirs('materials', exist_ok=True)
             print('Making path: materials')
 
             copy2(os.path.join(DATA_PATH, 'ground.rad'), 'materials')
         # if views directory doesn't exist, create it with two default views - side.vp and front.vp
-        if not os.path.exists('views'):
-            os.makedirs('views')
+        if not os.path.isdir('views'):
+            os.makedirs('views', exist_ok=True)
             with open(os.path.join('views', 'side.vp'), 'w') as f:
                 f.write('rvu -vtv -vp -10 1.5 3 -vd 1.581 0 -0.519234 '+
                         '-vu 0 0 1 -vh 45 -vv 45 -vo 0 -va 0 -vs 0 -vl 0')
@@ -777,17 +777,20 @@ class RadianceObj(SuperClass):
                 if self.metdata.albedo is not None:
                     material = self.metdata.albedo
                     print(" Assigned Albedo from metdata.albedo")
-            except:
+            except AttributeError:
                 pass
             
         self.ground = GroundObj(material, material_file)
 
 
-    def getEPW(self, lat=None, lon=None, GetAll=False):
+    def getEPW(self, lat=None, lon=None, GetAll=False, forceDownload=False):
         """
         Subroutine to download nearest epw files to latitude and longitude provided,
         into the directory /EPWs/
         based on github/aahoo.
+        The station index is fetched once per session, and a weather file
+        already present in /EPWs/ is reused instead of downloaded again,
+        unless forceDownload is set.
         
         .. warning::
             verify=false is required to operate within NLR's network.
@@ -802,6 +805,9 @@ class RadianceObj(SuperClass):
             Longitude value to find closest EPW file.
         GetAll : boolean 
             Download all available files. Note that no epw file will be loaded into memory
+        forceDownload : boolean, default False
+            Re-download the station index and the weather file(s) even if
+            they were already fetched or exist in /EPWs/.
         
         
         """
@@ -813,70 +819,97 @@ class RadianceObj(SuperClass):
                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'
                }
 
+        # one session so the index and every EPW download reuse the
+        # keep-alive connection instead of a new TLS handshake per file
+        session = requests.Session()
+
         path_to_save = 'EPWs' # create a directory and write the name of directory here
         if not os.path.exists(path_to_save):
             os.makedirs(path_to_save)
 
         def _returnEPWnames():
             ''' return a dataframe with the name, lat, lon, url of available files'''
-            r = requests.get('https://github.com/NatLabRockies/EnergyPlus/raw/develop/weather/master.geojson', verify=False)
+            if 'df' in _EPW_INDEX_CACHE and not forceDownload:
+                return _EPW_INDEX_CACHE['df']
+            r = session.get('https://github.com/NatLabRockies/EnergyPlus/raw/develop/weather/master.geojson', verify=False)
             data = r.json() #metadata for available files
             #download lat/lon and url details for each .epw file into a dataframe
-            df = pd.DataFrame({'url':[], 'lat':[], 'lon':[], 'name':[]})
+            urls, lats, lons, names = [], [], [], []
+            href = re.compile(r'href=[\'"]?([^\'" >]+)')
             for location in data['features']:
-                match = re.search(r'href=[\'"]?([^\'" >]+)', location['properties']['epw'])
+                match = href.search(location['properties']['epw'])
                 if match:
                     url = match.group(1)
-                    name = url[url.rfind('/') + 1:]
-                    lontemp = location['geometry']['coordinates'][0]
-                    lattemp = location['geometry']['coordinates'][1]
-                    dftemp = pd.DataFrame({'url':[url], 'lat':[lattemp], 'lon':[lontemp], 'name':[name]})
-                    #df = df.append(dftemp, ignore_index=True)
-                    df = pd.concat([df, dftemp], ignore_index=True)
+                    urls.append(url)
+                    names.append(url[url.rfind('/') + 1:])
+                    lons.append(location['geometry']['coordinates'][0])
+                    lats.append(location['geometry']['coordinates'][1])
+            df = pd.DataFrame({'url':pd.Series(urls, dtype=object),
+                               'lat':np.array(lats, dtype=float),
+                               'lon':np.array(lons, dtype=float),
+                               'name':pd.Series(names, dtype=object)})
+            _EPW_INDEX_CACHE['df'] = df
             return df
 
         def _findClosestEPW(lat, lon, df):
-            #locate the record with the nearest lat/lon
-            errorvec = np.sqrt(np.square(df.lat - lat) + np.square(df.lon - lon))
-            index = errorvec.idxmin()
-            url = df['url'][index]
-            name = df['name'][index]
+            #locate the record with the nearest lat/lon. sqrt is monotonic,
+            #so the squared distance picks the same record
+            errorvec = (np.square(df['lat'].to_numpy(dtype=float) - lat) +
+                        np.square(df['lon'].to_numpy(dtype=float) - lon))
+            index = np.nanargmin(errorvec)
+            url = df['url'].iat[index]
+            name = df['name'].iat[index]
             return url, name
 
         def _downloadEPWfile(url, path_to_save, name):
-            r = requests.get(url, verify=False, headers=hdr)
-            if r.ok:
-                filename = os.path.join(path_to_save, name)
-                # py2 and 3 compatible: binary write, encode text first
-                with open(filename, 'wb') as f:
-                    f.write(r.text.encode('ascii', 'ignore'))
-                print(' ... OK!')
+            filename = os.path.join(path_to_save, name)
+            if (not forceDownload and os.path.isfile(filename) and
+                    os.path.getsize(filename) > 0):
+                print(' ... already downloaded, reusing %s' %(filename))
+                return
+            # stream into a .part file and only move it into place once
+            # complete, so an interrupted download is never reused
+            partfile = filename + '.part'
+            try:
+                with session.get(url, verify=False, headers=hdr, stream=True) as r:
+                    if r.ok:
+                        # drop non-ascii bytes as the EPW readers expect plain ascii
+                        with open(partfile, 'wb') as f:
+                            for chunk in r.iter_content(chunk_size=64*1024):
+                                f.write(chunk.decode('ascii', 'ignore').encode('ascii'))
+                        os.replace(partfile, filename)
+                        print(' ... OK!')
+                    else:
+                        print(' connection error status code: %s' %(r.status_code))
+                        r.raise_for_status()
+            except Exception:
+                if os.path.exists(partfile):
+                    os.remove(partfile)
+                raise
+
+        with session:
+            # Get the list of EPW filenames and lat/lon
+            df = _returnEPWnames()
+
+            # find the closest EPW file to the given lat/lon
+            if (lat is not None) & (lon is not None) & (GetAll is False):
+                url, name = _findClosestEPW(lat, lon, df)
+
+                # download the EPW file to the local drive.
+                print('Getting weather file: ' + name)
+                _downloadEPWfile(url, path_to_save, name)
+                self.epwfile = os.path.join('EPWs', name)
+
+            elif GetAll is True:
+                if input('Downloading ALL EPW files available. OK? [y/n]') == 'y':
+                    # get all of the EPW files
+                    for index, row in df.iterrows():
+                        print('Getting weather file: ' + row['name'])
+                        _downloadEPWfile(row['url'], path_to_save, row['name'])
+                self.epwfile = None
             else:
-                print(' connection error status code: %s' %(r.status_code))
-                r.raise_for_status()
-
-        # Get the list of EPW filenames and lat/lon
-        df = _returnEPWnames()
-
-        # find the closest EPW file to the given lat/lon
-        if (lat is not None) & (lon is not None) & (GetAll is False):
-            url, name = _findClosestEPW(lat, lon, df)
-
-            # download the EPW file to the local drive.
-            print('Getting weather file: ' + name)
-            _downloadEPWfile(url, path_to_save, name)
-            self.epwfile = os.path.join('EPWs', name)
-
-        elif GetAll is True:
-            if input('Downloading ALL EPW files available. OK? [y/n]') == 'y':
-                # get all of the EPW files
-                for index, row in df.iterrows():
-                    print('Getting weather file: ' + row['name'])
-                    _downloadEPWfile(row['url'], path_to_save, row['name'])
-            self.epwfile = None
-        else:
-            print('Nothing returned. Proper usage: epwfile = getEPW(lat,lon)')
-            self.epwfile = None
+                print('Nothing returned. Proper usage: epwfile = getEPW(lat,lon)')
+                self.epwfile = None
 
         return self.epwfile
       
@@ -931,7 +964,7 @@ class RadianceObj(SuperClass):
             else:
                 try:
                     weatherFile = _interactive_load('Select EPW or TMY3 climate file')
-                except:
+                except Exception:
                     raise Exception('Interactive load failed. Tkinter not supported'+
                                     'on this system. Try installing X-Quartz and reloading')
         if coerce_year is not None:
@@ -1687,7 +1720,7 @@ class RadianceObj(SuperClass):
         if metdata is None:
             try:
                 metdata = self.metdata
-            except:
+            except AttributeError:
                 print('usage: pass metdata, or run after running ' +
                       'readWeatherfile() ') 
                 return
@@ -1711,7 +1744,7 @@ class RadianceObj(SuperClass):
             else:
                 warnings.warn("Shape of ground Albedos and TMY data do not match.")
                 return
-        except:
+        except (AttributeError, IndexError):
             print('usage: make sure to run setGround() before gendaylit()')
             return
 
@@ -1814,7 +1847,7 @@ class RadianceObj(SuperClass):
                 print("Ambiguous albedo entry, Set albedo to single value "
                       "in setGround()")
                 return
-        except:
+        except (AttributeError, IndexError):
             print('usage: make sure to run setGround() before gendaylit()')
             return
         
@@ -1913,7 +1946,7 @@ class RadianceObj(SuperClass):
         # Assign Albedos
         try:
             groundstring = self.ground._makeGroundString(cumulativesky=True)
-        except:
+        except AttributeError:
             raise Exception('Error: ground reflection not defined.  '
                             'Run RadianceObj.setGround() first')
             return
@@ -2096,13 +2129,19 @@ class RadianceObj(SuperClass):
         count = 0  # counter to get number of skyfiles created, just for giggles
 
         trackerdict2=TrackerDict({})
+        # parse all keys at once and look up their metdata index in a dict,
+        # rather than a strptime and a linear list search per key
+        keys = list(trackerdict.keys())
+        time_targets = pd.to_datetime(keys, format="%Y-%m-%d_%H%M").tz_localize(int(self.metdata.timezone*3600))
+        timeindex = {}
+        for i, t in enumerate(metdata.datetime):
+            timeindex.setdefault(t, i)  # keep first match, like list.index
         #for i in range(0, len(trackerdict.keys())):
-        for key in trackerdict.keys():
-            time_target = pd.to_datetime(key, format="%Y-%m-%d_%H%M").tz_localize(int(self.metdata.timezone*3600))
+        for key, time_target in zip(keys, time_targets):
             try:
-                i = metdata.datetime.index(time_target)
-            except IndexError:  #out of range error
-                break  # 
+                i = timeindex[time_target]
+            except KeyError:  # timestamp not in metdata; skip just this key
+                continue
             #filename = str(time)[5:-12].replace('-','_').replace(' ','_')
             self.name = key
 
@@ -2502,7 +2541,7 @@ class RadianceObj(SuperClass):
                 scene.radfiles.append(sceneRAD)
                 if debug:
                     print( "Radfile APPENDED!")
-            except:
+            except AttributeError:
                 #TODO: Manage situation where radfile was created with
                 #appendRadfile to False first..
                 scene.radfiles=[]
@@ -2686,9 +2725,10 @@ class RadianceObj(SuperClass):
                 radname = '1axis%s_'%(theta,)
 
                 # Calculating clearance height for this theta.
-                height = hubheight - simplefix*0.5* math.sin(abs(theta) * math.pi / 180) \
+                sintheta = math.sin(abs(theta) * math.pi / 180)
+                height = hubheight - simplefix*0.5* sintheta \
                         * scene.module.sceney + scene.module.offsetfromaxis \
-                        * math.sin(abs(theta)*math.pi/180)
+                        * sintheta
                 # Calculate the ground clearance height based on the hub height. Add abs(theta) to avoid negative tilt angle errors
                 #trackerdict[theta]['clearance_height'] = height
 
@@ -2720,21 +2760,20 @@ class RadianceObj(SuperClass):
             print('\nMaking ~%s .rad files for gendaylit 1-axis workflow (this takes a minute..)' % (len(trackerdict)))
             count = 0
             for time in trackerdict:
-                scene = SceneObj(module, hpc=self.hpc)
-
                 if trackerdict[time]['surf_azm'] >= 180:
                     trackerdict[time]['surf_azm'] = trackerdict[time]['surf_azm']-180
                     trackerdict[time]['surf_tilt'] = trackerdict[time]['surf_tilt']*-1
-                theta = trackerdict[time]['theta']
-                radname = '1axis%s_'%(time,)
-
-                # Calculating clearance height for this time.
-                height = hubheight - simplefix*0.5* math.sin(abs(theta) * math.pi / 180) \
-                        * scene.module.sceney + scene.module.offsetfromaxis \
-                        * math.sin(abs(theta)*math.pi/180)
 
                 if trackerdict[time]['ghi'] > 0:
+                    scene = SceneObj(module, hpc=self.hpc)
+                    theta = trackerdict[time]['theta']
+                    radname = '1axis%s_'%(time,)
 
+                    # Calculating clearance height for this time.
+                    sintheta = math.sin(abs(theta) * math.pi / 180)
+                    height = hubheight - simplefix*0.5* sintheta \
+                            * scene.module.sceney + scene.module.offsetfromaxis \
+                            * sintheta
 
                     sceneDict.update({'tilt' : trackerdict[time]['surf_tilt'],
                                      'clearance_height' :  height,
@@ -3106,7 +3145,7 @@ class RadianceObj(SuperClass):
         self.compiledResults = pd.DataFrame(None)
 
         if not self.cumulativesky:
-                            
+            rows = []
             for key in keys:
         
                 meteo_data = _trackerMeteo(trackerdict[key])
@@ -3125,16 +3164,14 @@ class RadianceObj(SuperClass):
                                                         module=module_local,
                                                         cumulativesky=self.cumulativesky,   
                                                         CECMod2=CECMod2)
-                        self.compiledResults = pd.concat([self.compiledResults, 
-                                                            _printRow(analysis, key).assign(
-                                                                module_CEC_name=module_local.CECMod.name)], 
-                                                            ignore_index=True)
+                        rows.append(_printRow(analysis, key).assign(
+                                        module_CEC_name=module_local.CECMod.name))
                 except KeyError:
                     pass
-                
-                        
-                    
-            
+
+            if rows:
+                self.compiledResults = pd.concat(rows, ignore_index=True)
+
         else: #cumulative analysis
             if module is None:
                 for key in keys:  # loop over trackerdict to find first available module
@@ -3665,7 +3702,7 @@ class SceneObj(SuperClass):
             else:
                 raise Exception('default to gcr')
             
-        except:
+        except Exception:
 
             if 'gcr' in sceneDict:
                 pitch = np.round(self.module.sceney/sceneDict['gcr'],3)
@@ -3915,7 +3952,7 @@ class SceneObj(SuperClass):
             self.radfiles.append(scenePilesRad)
             if debug:
                 print( "Piles Radfile Appended")
-        except:
+        except AttributeError:
             #TODO: Manage situation where radfile was created with
             #appendRadfile to False first..
             self.radfiles=[]
@@ -4216,23 +4253,25 @@ class MetObj(SuperClass):
         else:
             # trackerdict uses timestamp as keys. return azimuth
             # and tilt for each timestamp
+            # remove night-time and NaN tracker theta from trackerdict.
+            # mask is computed for all timestamps at once.
+            valid = np.flatnonzero((np.asarray(self.ghi) > 0) &
+                                   ~np.isnan(np.asarray(self.tracker_theta, dtype=float)))
             #times = [str(i)[5:-12].replace('-','_').replace(' ','_') for i in self.datetime]
-            times = [i.strftime('%Y-%m-%d_%H%M') for i in self.datetime]
+            times = pd.DatetimeIndex(self.datetime)[valid].strftime('%Y-%m-%d_%H%M')
             #trackerdict = dict.fromkeys(times)
             trackerdict = TrackerDict({})
-            for i,time in enumerate(times) :
-                # remove NaN tracker theta from trackerdict
-                if (self.ghi[i] > 0) & (~np.isnan(self.tracker_theta[i])):
-                    trackerdict[time] = TrackerDict({
-                                        'surf_azm':self.surface_azimuth[i],
-                                        'surf_tilt':self.surface_tilt[i],
-                                        'theta':self.tracker_theta[i],
-                                        'dni':self.dni[i],
-                                        'ghi':self.ghi[i],
-                                        'dhi':self.dhi[i],
-                                        'temp_air':self.temp_air[i],
-                                        'wind_speed':self.wind_speed[i]
-                                        })
+            for i,time in zip(valid, times) :
+                trackerdict[time] = TrackerDict({
+                                    'surf_azm':self.surface_azimuth[i],
+                                    'surf_tilt':self.surface_tilt[i],
+                                    'theta':self.tracker_theta[i],
+                                    'dni':self.dni[i],
+                                    'ghi':self.ghi[i],
+                                    'dhi':self.dhi[i],
+                                    'temp_air':self.temp_air[i],
+                                    'wind_speed':self.wind_speed[i]
+                                    })
 
         return trackerdict
 
@@ -4372,6 +4411,10 @@ class MetObj(SuperClass):
         '''
 
         dt = pd.to_datetime(self.datetime)
+        # format timestamps once; compared against each theta bin below
+        dtstr = dt.strftime('%Y-%m-%d %H:%M:%S')
+        ghi = np.asarray(self.ghi)
+        dhi = np.asarray(self.dhi)
 
         trackerdict = dict.fromkeys(theta_list)
 
@@ -4389,21 +4432,10 @@ class MetObj(SuperClass):
             trackerdict[theta]['count'] = datetimetemp.__len__()
             #Create new temp csv file with zero values for all times not equal to datetimetemp
             # write 8760 2-column csv:  GHI,DHI
-            dni_temp = []
-            ghi_temp = []
-            dhi_temp = []
-            for g, d, time in zip(self.ghi, self.dhi,
-                                  dt.strftime('%Y-%m-%d %H:%M:%S')):
-
-                # is this time included in a particular theta_round angle?
-                if time in datetimetemp:
-                    ghi_temp.append(g)
-                    dhi_temp.append(d)
-                else:
-                    # mask out irradiance at this time, since it
-                    # belongs to a different bin
-                    ghi_temp.append(0.0)
-                    dhi_temp.append(0.0)
+            # mask out irradiance at times that belong to a different bin
+            inbin = np.asarray(dtstr.isin(datetimetemp))
+            ghi_temp = np.where(inbin, ghi, 0.0)
+            dhi_temp = np.where(inbin, dhi, 0.0)
             # save in 2-column GHI,DHI format for gencumulativesky -G
             savedata = pd.DataFrame({'GHI':ghi_temp, 'DHI':dhi_temp},
                                     index = self.datetime).tz_localize(None)
@@ -4580,16 +4612,15 @@ class AnalysisObj(SuperClass):
         Ny = int(linePtsDict['Ny'])
         Nz = int(linePtsDict['Nz'])
 
-        x = []
-        y = []
-        z = []
+        # same point order as the nested z/x/y loop in _linePtsMake3D:
+        # iy varies fastest, then ix, and the Nx*Ny grid repeats Nz times.
+        ix, iy = np.meshgrid(np.arange(Nx), np.arange(Ny), indexing='ij')
+        ix = np.tile(ix.ravel(), Nz)
+        iy = np.tile(iy.ravel(), Nz)
 
-        for iz in range(0,Nz):
-            for ix in range(0,Nx):
-                for iy in range(0,Ny):
-                    x . append(xstart+iy*xinc+ix*sx_xinc)
-                    y . append(ystart+iy*yinc+ix*sx_yinc)
-                    z . append(zstart+iy*zinc+ix*sx_zinc)
+        x = (xstart+iy*xinc+ix*sx_xinc).tolist()
+        y = (ystart+iy*yinc+ix*sx_yinc).tolist()
+        z = (zstart+iy*zinc+ix*sx_zinc).tolist()
 
         return x, y, z
        
@@ -4620,22 +4651,21 @@ class AnalysisObj(SuperClass):
         #create linepts text input with variable x,y,z.
         #If you don't want to iterate over a variable, inc = 0, N = 1.
 
-        linepts = ""
         # make sure Nx, Ny, Nz are ints.
         Nx = int(Nx)
         Ny = int(Ny)
         Nz = int(Nz)
 
-
+        points = []
         for iz in range(0,Nz):
             for ix in range(0,Nx):
                 for iy in range(0,Ny):
                     xpos = xstart+iy*xinc+ix*sx_xinc
                     ypos = ystart+iy*yinc+ix*sx_yinc
                     zpos = zstart+iy*zinc+ix*sx_zinc
-                    linepts = linepts + str(xpos) + ' ' + str(ypos) + \
-                          ' '+str(zpos) + ' ' + orient + " \r"
-        return(linepts)
+                    points.append(str(xpos) + ' ' + str(ypos) + ' ' +
+                                  str(zpos) + ' ' + orient + " \r")
+        return(''.join(points))
 
     def _irrPlot(self, octfile, linepts, mytitle=None, plotflag=None,
                    accuracy='low'):
@@ -4720,16 +4750,14 @@ class AnalysisObj(SuperClass):
 
         # when file errors occur, temp_out is None, and err message is printed.
         if temp_out is not None:
-            for line in temp_out.splitlines():
-                temp = line.split('\t')
-                out['x'] = np.append(out['x'],float(temp[0]))
-                out['y'] = np.append(out['y'],float(temp[1]))
-                out['z'] = np.append(out['z'],float(temp[2]))
-                out['r'] = np.append(out['r'],float(temp[3]))
-                out['g'] = np.append(out['g'],float(temp[4]))
-                out['b'] = np.append(out['b'],float(temp[5]))
-                out['mattype'] = np.append(out['mattype'],temp[6])
-                out['Wm2'] = np.append(out['Wm2'], sum([float(i) for i in temp[3:6]])/3.0)
+            # parse all rtrace lines at once; np.append per line is quadratic
+            lines = [line.split('\t') for line in temp_out.splitlines()]
+            if lines:
+                cols = list(zip(*lines))
+                for i, key in enumerate(['x','y','z','r','g','b']):
+                    out[key] = np.array(cols[i], dtype=float)
+                out['mattype'] = np.array(cols[6])
+                out['Wm2'] = (out['r'] + out['g'] + out['b'])/3.0
 
 
             if plotflag is True:
@@ -4843,7 +4871,7 @@ class AnalysisObj(SuperClass):
             data_sub['Wm2Front'] = self.Wm2Front
             self.Wm2Back = reardata['Wm2']
             data_sub['Wm2Back'] = self.Wm2Back
-            self.backRatio = [x/(y+.001) for x,y in zip(reardata['Wm2'],data['Wm2'])] # add 1mW/m2 to avoid dividebyzero
+            self.backRatio = np.asarray(reardata['Wm2']) / (np.asarray(data['Wm2']) + .001) # add 1mW/m2 to avoid dividebyzero
             data_sub['Back/FrontRatio'] = self.backRatio
             df = pd.DataFrame.from_dict(data_sub)
             df.to_csv(savefile, sep = ',',
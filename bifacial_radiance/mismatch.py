@@ -6,6 +6,34 @@ Created on Tue Mar 26 20:16:47 2019
 """
 
 from deprecated import deprecated
+import numpy as np
+
+# cell placement for 'portrait' modules, used by _setupforPVMismatch.
+_STDPL_72 = np.array([[0,	23,	24,	47,	48,	71],
+        [1,	22,	25,	46,	49,	70],
+        [2,	21,	26,	45,	50,	69],
+        [3,	20,	27,	44,	51,	68],
+        [4,	19,	28,	43,	52,	67],
+        [5,	18,	29,	42,	53,	66],
+        [6,	17,	30,	41,	54,	65],
+        [7,	16,	31,	40,	55,	64],
+        [8,	15,	32,	39,	56,	63],
+        [9,	14,	33,	38,	57,	62],
+        [10,	13,	34,	37,	58,	61],
+        [11,	12,	35,	36,	59,	60]])
+
+_STDPL_96 = np.array([[0,	23,	24,	47,	48,	71,	72,	95],
+        [1,	22,	25,	46,	49,	70,	73,	94],
+        [2,	21,	26,	45,	50,	69,	74,	93],
+        [3,	20,	27,	44,	51,	68,	75,	92],
+        [4,	19,	28,	43,	52,	67,	76,	91],
+        [5,	18,	29,	42,	53,	66,	77,	90],
+        [6,	17,	30,	41,	54,	65,	78,	89],
+        [7,	16,	31,	40,	55,	64,	79,	88],
+        [8,	15,	32,	39,	56,	63,	80,	87],
+        [9,	14,	33,	38,	57,	62,	81,	86],
+        [10,	13,	34,	37,	58,	61,	82,	85],
+        [11,	12,	35,	36,	59,	60,	83,	84]])
 
 
 
@@ -15,26 +43,24 @@ def _sensorupsampletocellsbyInterpolation(df, cellsy):
     Function for when sensorsy in the results are less than cellsy desired.
     Interpolates the dataframe.
     
-    #2DO: improve interpolation with pandas. right onw it's row by row.
-    
     _sensorupsampletocellsbyInterpolation(df, cellsy)
     '''
     
-    import pandas as pd
     import numpy as np
+    import pandas as pd
     
     sensorsy = len(df)
     
     #2DO: Update this section to match bifacialvf
-    cellCenterPVM=[]                                    
-    for i in range (0, cellsy):
-        cellCenterPVM.append((i*sensorsy/cellsy+(i+1)*sensorsy/cellsy)/2)
+    i = np.arange(cellsy)
+    cellCenterPVM = (i*sensorsy/cellsy+(i+1)*sensorsy/cellsy)/2
+    sensorpos = np.arange(sensorsy)
     
-    df2 = pd.DataFrame()
-    for j in range (0, len(df.keys())):
-        A = list(df[df.keys()[j]])
-        B= np.interp(cellCenterPVM, list(range(0,sensorsy)), A)
-        df2[df.keys()[j]]=B
+    # build all interpolated columns first; inserting them one at a time
+    # into an empty DataFrame re-allocates it on every column
+    df2 = pd.DataFrame({key: np.interp(cellCenterPVM, sensorpos,
+                                       df[key].to_numpy(dtype=float))
+                        for key in df.keys()})
     
     return df2
     
@@ -46,13 +72,13 @@ def _sensorsdownsampletocellsbyAverage(df, cellsy):
     example:
     F_centeraverages = _sensorsdownsampletocellsbyAverage(F, cellsy)
     '''
-    import numpy as np
     import pandas as pd
 
-    edges=len(df)-np.floor(len(df)/(cellsy))*(cellsy)
-    edge1=int(np.floor(edges/2))
-    edge2=int(edges-edge1)
-    A = list(range(df.index[0]+edge1, df.index[-1]-edge2+2, int(np.floor(len(df)/(cellsy)))))
+    step = len(df)//cellsy
+    edges = len(df) - step*cellsy
+    edge1 = edges//2
+    edge2 = edges-edge1
+    A = list(range(df.index[0]+edge1, df.index[-1]-edge2+2, step))
     B = range(0,len(A)-1,1)
     C = [df.iloc[A[x]:A[x+1]].mean(axis=0) for x in B]
     df_centeraverages=pd.DataFrame(C)
@@ -68,13 +94,11 @@ def _sensorsdownsampletocellbyCenter(df, cellsy):
     F_centervalues = _sensorsdownsampletocellbyCenter(F, cellsy)
     '''
 
-    import numpy as np
-
-    
-    edges=len(df)-np.floor(len(df)/(cellsy))*(cellsy)
-    edge1=int(np.floor(edges/2))
-    edge2=int(edges-edge1)
-    A = list(range(df.index[0]+edge1, df.index[-1]-edge2+2, int(np.floor(len(df)/(cellsy)))))
+    step = len(df)//cellsy
+    edges = len(df) - step*cellsy
+    edge1 = edges//2
+    edge2 = edges-edge1
+    A = list(range(df.index[0]+edge1, df.index[-1]-edge2+2, step))
     A = [int(x+(A[1]-A[0])*0.5) for x in A]
     A = A[:-1]
     df_centervalues=df.loc[A]
@@ -89,36 +113,10 @@ def _setupforPVMismatch(portraitorlandscape, sensorsy, numcells=72):
     stdpl, cellsx, cellsy = _setupforPVMismatch(portraitorlandscape='portrait', sensorsy=100):
     '''
 
-    import numpy as np
-
-        # cell placement for 'portrait'.
     if numcells == 72:
-        stdpl=np.array([[0,	23,	24,	47,	48,	71],
-        [1,	22,	25,	46,	49,	70],
-        [2,	21,	26,	45,	50,	69],
-        [3,	20,	27,	44,	51,	68],
-        [4,	19,	28,	43,	52,	67],
-        [5,	18,	29,	42,	53,	66],
-        [6,	17,	30,	41,	54,	65],
-        [7,	16,	31,	40,	55,	64],
-        [8,	15,	32,	39,	56,	63],
-        [9,	14,	33,	38,	57,	62],
-        [10,	13,	34,	37,	58,	61],
-        [11,	12,	35,	36,	59,	60]])
-    
+        stdpl = _STDPL_72.copy()
     elif numcells == 96:
-        stdpl=np.array([[0,	23,	24,	47,	48,	71,	72,	95],
-            [1,	22,	25,	46,	49,	70,	73,	94],
-            [2,	21,	26,	45,	50,	69,	74,	93],
-            [3,	20,	27,	44,	51,	68,	75,	92],
-            [4,	19,	28,	43,	52,	67,	76,	91],
-            [5,	18,	29,	42,	53,	66,	77,	90],
-            [6,	17,	30,	41,	54,	65,	78,	89],
-            [7,	16,	31,	40,	55,	64,	79,	88],
-            [8,	15,	32,	39,	56,	63,	80,	87],
-            [9,	14,	33,	38,	57,	62,	81,	86],
-            [10,	13,	34,	37,	58,	61,	82,	85],
-            [11,	12,	35,	36,	59,	60,	83,	84]])
+        stdpl = _STDPL_96.copy()
     else:
         print("Error. Only 72 and 96 cells modules supported at the moment. Change numcells to either of this options!")
         return
@@ -143,16 +141,17 @@ def calculatePVMismatch(pvsys, stdpl, cellsx, cellsy, Gpoat):
     '''
 
     import numpy as np
-    
-    if np.mean(Gpoat) < 0.001:
+
+    Gmean = np.mean(Gpoat)
+    if Gmean < 0.001:
         PowerAveraged = 0
         PowerDetailed = 0
     else:                                   
         # makes the system  # 1 module, in portrait mode.         
-        G=np.array([Gpoat]).transpose()
-        H = np.ones([1,cellsx]) 
-        array_det = np.dot(G,H) 
-        array_avg = np.ones([cellsy,cellsx])*np.mean(Gpoat)        
+        # each cell in a row sees that row's irradiance (was G x ones matmul)
+        array_det = np.repeat(np.asarray(Gpoat, dtype=float).reshape(-1, 1),
+                              cellsx, axis=1)
+        array_avg = np.full([cellsy,cellsx], Gmean)
                                 
         # ACtually do calculations
         pvsys.setSuns({0: {0: [array_avg, stdpl]}})
@@ -276,8 +275,13 @@ def mad_fn(data, axis='index'):
     '''
     import numpy as np
     import pandas as pd
-    def _mad_1D(data):  #1D calculation of MAD
-        return (np.abs(np.subtract.outer(data,data)).sum()/float(data.__len__())**2 / np.mean(data))*100
+    def _mad(data):  # MAD along the last axis, for 1D or 2D arrays
+        # for sorted G, Sum Sum abs(G_i - G_j) = 2 * Sum_k (2k - n + 1) * G_k,
+        # which avoids building the n x n difference matrix
+        data = np.sort(np.asarray(data, dtype=float), axis=-1)
+        n = data.shape[-1]
+        weights = 2*np.arange(n) - n + 1
+        return (2*(data*weights).sum(axis=-1)/float(n)**2 / data.mean(axis=-1))*100
     if type(axis) == str:
         try:
             axis = {"index": 0, "rows": 0, 'columns':1}[axis]
@@ -292,12 +296,11 @@ def mad_fn(data, axis='index'):
         data = data.to_numpy()
     
     if type(data) == pd.DataFrame:
-        temp = data.apply(pd.Series.to_numpy, axis=1)
-        return(temp.apply(_mad_1D))
+        return pd.Series(_mad(data.to_numpy()), index=data.index)
     elif ndim ==2: #2D array
-        return [_mad_1D(i) for i in data]
+        return list(_mad(data))
     else:
-        return _mad_1D(data)
+        return _mad(data)
 
 
 @deprecated(reason='This analysis script will be moved to its own tutorial' +\
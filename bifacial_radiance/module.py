@@ -11,6 +11,13 @@ import pvlib
 import pandas as pd
 
 from bifacial_radiance.main import _missingKeyWarning, _popen, DATA_PATH
+
+# SAPM cell temperature coefficients (a, b, deltaT), keyed by glassglass
+_SAPM_TEMP_PARAMS = {
+    glassglass: tuple(pvlib.temperature.TEMPERATURE_MODEL_PARAMETERS['sapm'][key][k]
+                      for k in ('a', 'b', 'deltaT'))
+    for glassglass, key in ((True, 'open_rack_glass_glass'),
+                            (False, 'open_rack_glass_polymer'))}
  
 class SuperClass:
     def __repr__(self):
@@ -777,25 +784,14 @@ class ModuleObj(SuperClass):
         if hasattr(self, 'glassglass') and glassglass is None:
             glassglass = self.glassglass
 
-        from pvlib.temperature import TEMPERATURE_MODEL_PARAMETERS
-
-        # Setting temperature_model_parameters
-        if glassglass:
-            temp_model_params = (
-                TEMPERATURE_MODEL_PARAMETERS['sapm']['open_rack_glass_glass'])
-        else:
-            temp_model_params = (
-                TEMPERATURE_MODEL_PARAMETERS['sapm']['open_rack_glass_polymer'])
-
         if temp_cell is None:
             if temp_air is None:
                 temp_air = 25  # STC
 
+            # SAPM (a, b, deltaT) for glass-glass or glass-polymer packaging
+            a, b, deltaT = _SAPM_TEMP_PARAMS[bool(glassglass)]
             temp_cell = pvlib.temperature.sapm_cell(effective_irradiance, temp_air,
-                                                    wind_speed,
-                                                    temp_model_params['a'],
-                                                    temp_model_params['b'],
-                                                    temp_model_params['deltaT'])
+                                                    wind_speed, a, b, deltaT)
 
         if isinstance(CECMod, pd.DataFrame):
             #CECMod.to_pickle("CECMod.pkl")  
@@ -10,6 +10,24 @@ import pandas as pd
 import numpy as np
 
 
+def _filterMeasModel(meas, model):
+    """
+    Return measured and modeled data as float arrays, dropping entries where
+    either value is NaN or the modeled value is not above the minimum
+    measured value (rudimentary filtering of modeled irradiance).
+    Raises ZeroDivisionError if no pairs are left after filtering.
+    """
+    if isinstance(meas, pd.Series) and isinstance(model, pd.Series):
+        meas, model = meas.align(model)
+    meas = np.asarray(meas, dtype=float)
+    model = np.asarray(model, dtype=float)
+    minirr = np.nanmin(meas)
+    mask = ~np.isnan(model) & ~np.isnan(meas) & (model > minirr)
+    if not mask.any():
+        raise ZeroDivisionError('No measured/modeled pairs left after filtering.')
+    return meas[mask], model[mask]
+
+
 def MBD(meas, model):
     """
     This function calculates the MEAN BIAS DEVIATION of measured vs. modeled
@@ -32,13 +50,8 @@ def MBD(meas, model):
 
     """
 
-    df = pd.DataFrame({'model': model, 'meas': meas})
-    # rudimentary filtering of modeled irradiance
-    df = df.dropna()
-    minirr = meas.min()
-    df = df[df.model > minirr]
-    m = df.__len__()
-    out = 100*((1/m)*sum(df.model-df.meas))/df.meas.mean()
+    meas_arr, model_arr = _filterMeasModel(meas, model)
+    out = 100*np.mean(model_arr-meas_arr)/np.mean(meas_arr)
     return out
 
 
@@ -64,14 +77,8 @@ def RMSE(meas, model):
 
     """
 
-
-
-    df = pd.DataFrame({'model': model, 'meas': meas})
-    df = df.dropna()
-    minirr = meas.min()
-    df = df[df.model > minirr]
-    m = df.__len__()
-    out = 100*np.sqrt(1/m*sum((df.model-df.meas)**2))/df.meas.mean()
+    meas_arr, model_arr = _filterMeasModel(meas, model)
+    out = 100*np.sqrt(np.mean((model_arr-meas_arr)**2))/np.mean(meas_arr)
     return out
 
 
@@ -98,13 +105,8 @@ def MBD_abs(meas, model):
 
     """
 
-    df = pd.DataFrame({'model': model, 'meas': meas})
-    # rudimentary filtering of modeled irradiance
-    df = df.dropna()
-    minirr = meas.min()
-    df = df[df.model > minirr]
-    m = df.__len__()
-    out = ((1/m)*sum(df.model-df.meas))
+    meas_arr, model_arr = _filterMeasModel(meas, model)
+    out = np.mean(model_arr-meas_arr)
     return out
 
 
@@ -130,26 +132,35 @@ def RMSE_abs(meas, model):
 
     """
 
-    #
-
-    df = pd.DataFrame({'model': model, 'meas': meas})
-    df = df.dropna()
-    minirr = meas.min()
-    df = df[df.model > minirr]
-    m = df.__len__()
-    out = np.sqrt(1/m*sum((df.model-df.meas)**2))
+    meas_arr, model_arr = _filterMeasModel(meas, model)
+    out = np.sqrt(np.mean((model_arr-meas_arr)**2))
     return out
 
 
+# Sensor material names dropped by _cleanDataFrameResults. 'ground' is only
+# dropped on rows with a rear scan (agriPV rows measure the ground itself).
+_MATCH_AGRIPV = '|'.join(['sky', 'pole', 'tube', 'bar', '3267', '1540'])
+_MATCH_GROUND = 'ground'
+
+
+def _matchMaterials(mat, agriPV):
+    """
+    Boolean mask of sensors in `mat` whose material name matches
+    _MATCH_AGRIPV, or _MATCH_GROUND on rows not flagged in `agriPV`.
+    """
+    flat = pd.Series(mat.to_numpy(dtype=object).ravel())
+    mask = flat.str.contains(_MATCH_AGRIPV, na=False).to_numpy()
+    mask_ground = flat.str.contains(_MATCH_GROUND, na=False).to_numpy()
+    mask = mask | (mask_ground & np.repeat(~agriPV, mat.shape[1]))
+    return mask.reshape(mat.shape)
+
+
 def _cleanDataFrameResults(mattype, rearMat, Wm2Front, Wm2Back,
                            fillcleanedSensors=False):
 
-    # 2D array of values. if a row of rearMat is nan then it's single-sided and
-    # agriPV is true for that row
-    _matchAgriPV = ['sky', 'pole', 'tube', 'bar', '3267', '1540', '1540']
-    _match = ['sky', 'pole', 'tube', 'bar', 'ground', '3267', '1540']
-    matcharray = np.row_stack([_matchAgriPV if row.isna().all() else _match 
-                               for (n,row) in rearMat.iterrows()])
+    # if a row of rearMat is nan then it's single-sided and
+    # agriPV is true for that row. Computed once and reused for front and back
+    agriPV = rearMat.isna().all(axis=1).to_numpy()
     """
     if Wm2Front.size != Wm2Back.size:
         agriPV = True
@@ -159,16 +170,12 @@ def _cleanDataFrameResults(mattype, rearMat, Wm2Front, Wm2Back,
         matchers = ['sky', 'pole', 'tube', 'bar', 'ground', '3267', '1540']
     """
 
-    maskfront = np.row_stack([row.str.contains('|'.join(matcharray[index]),
-                                                           na=False) for (index, row) in
-                                 mattype.iterrows()])
+    maskfront = _matchMaterials(mattype, agriPV)
     
     Wm2Front[maskfront] = np.nan
 
     try:
-        maskback = np.row_stack([row.str.contains('|'.join(matcharray[index]),
-                                                               na=False) for (index, row) in
-                                     rearMat.iterrows()])
+        maskback = _matchMaterials(rearMat, agriPV)
         Wm2Back[maskback] = np.nan
     except AttributeError:  # rearMat is empty
         pass  
@@ -176,12 +183,14 @@ def _cleanDataFrameResults(mattype, rearMat, Wm2Front, Wm2Back,
     # Filling Nans...
     filledFront = Wm2Front.mean(axis=1)
 
+    # interpolate() already returns new frames, and no caller mutates the
+    # cleaned frames, so they are not copied.
     if fillcleanedSensors:
-        frontcopy = Wm2Front.copy().interpolate(axis=1)
-        filledBack = Wm2Back.copy().interpolate(axis=1)
+        frontcopy = Wm2Front.interpolate(axis=1)
+        filledBack = Wm2Back.interpolate(axis=1)
     else:
-        frontcopy = Wm2Front.copy()
-        filledBack = Wm2Back.copy()  # interpolate()
+        frontcopy = Wm2Front
+        filledBack = Wm2Back  # interpolate()
 
     return filledFront, filledBack, frontcopy
 
@@ -418,43 +427,20 @@ def calculatePerformanceGencumsky(csvfile=None, results=None,
     filledFront, filledBack, frontcopy = _cleanDataFrameResults(
         mattype, rearMat, Wm2Front, Wm2Back,
         fillcleanedSensors=fillcleanedSensors)
-    cumFront = []
-    cumWM2 = []
-    cumBack = []
-    cumRow = []
-    cumMod = []
-    cumScene = []
-    Grear_mean = []
-#    Gfront_mean = []
-    POA_eff = []
-
     # NOTE change 26.07.22 'row' -> 'rowNum' and 'mod' -> 'ModNumber
     # NOTE change March 13 2024 ModNumber -> modNum
-    #for rownum in results['rowNum'].unique():
-    #    for modnum in results['modNum'].unique():
-    for i, df in results.groupby(['rowNum','modNum','sceneNum']):
-        #mask = (results['rowNum'] == rownum) & (
-        #    results['modNum'] == modnum)
-        cumBack.append(list(filledBack.loc[df.index].sum(axis=0, min_count=1)))
-        cumFront.append(filledFront.loc[df.index].sum(axis=0, min_count=1))
-        cumWM2.append(list(frontcopy.loc[df.index].sum(axis=0, min_count=1)))
-        cumRow.append(i[0])
-        cumMod.append(i[1])
-        cumScene.append(i[2])
-
-
-        # Maybe this would be faster by first doing the DF with the above,
-        # exploding the column and calculating.
-        POA_eff.append(list(
-            (filledBack.loc[df.index].apply(lambda x: x*bifacialityfactor +
-                                    filledFront.loc[df.index])).sum(axis=0)))
-        Grear_mean.append(filledBack.loc[df.index].sum(axis=0, min_count=1).mean())
-        # Gfront_mean.append(filledFront[mask].sum(axis=0).mean())
-
-    dfst = pd.DataFrame(zip(cumRow, cumMod, cumScene, cumFront, cumWM2, cumBack, Grear_mean,
-                            POA_eff), columns=('rowNum', 'modNum','sceneNum', 'Gfront_mean',
-                                               'Wm2Front', 'Wm2Back', 'Grear_mean',
-                                               'POA_eff'))
+    # Sum each (row, module, scene) group with one groupby pass per frame
+    # instead of re-indexing every frame once per group.
+    keys = [results['rowNum'], results['modNum'], results['sceneNum']]
+    cumBack = filledBack.groupby(keys).sum(min_count=1)
+    POA_eff = filledBack.mul(bifacialityfactor).add(filledFront, axis=0
+                                                    ).groupby(keys).sum()
+    dfst = pd.DataFrame({
+        'Gfront_mean': filledFront.groupby(keys).sum(min_count=1),
+        'Wm2Front': frontcopy.groupby(keys).sum(min_count=1).values.tolist(),
+        'Wm2Back': cumBack.values.tolist(),
+        'Grear_mean': cumBack.mean(axis=1),
+        'POA_eff': POA_eff.values.tolist()}, index=cumBack.index).reset_index()
 
     dfst['BGG'] = dfst['Grear_mean']*100*bifacialityfactor/dfst['Gfront_mean']
 
@@ -2,9 +2,6 @@ import numpy as np
 import pandas as pd
 from collections.abc import Iterable
 import os
-from scipy import integrate
-from tqdm import tqdm
-from pvlib import iotools
 
 
 class spectral_property(object):
@@ -276,6 +273,9 @@ def generate_spectra(metdata, simulation_path, ground_material='Gravel', spectra
 
     """
 
+    from scipy import integrate
+    from tqdm import tqdm
+
     # make the datetime easily readable and indexed
     dts = pd.Series(data=metdata.datetime)
 
@@ -288,10 +288,9 @@ def generate_spectra(metdata, simulation_path, ground_material='Gravel', spectra
     else:
         print(' -=   Spectral Simulation   =- \n Spectra files will be saved.')
 
-    for dt in tqdm(dts,ncols=100,desc='Generating Spectra'):
+    for idx, dt in enumerate(tqdm(dts,ncols=100,desc='Generating Spectra')):
 
         # scrape all the necessary metadata
-        idx = dts.index[dts==dt][0]
         dni = metdata.dni[idx]
         dhi = metdata.dhi[idx]
         ghi = metdata.ghi[idx]
@@ -314,7 +313,7 @@ def generate_spectra(metdata, simulation_path, ground_material='Gravel', spectra
         # generate the base spectra
         try:
             spectral_dni, spectral_dhi, spectral_ghi = spectral_irradiance_smarts(zen, azm, min_wavelength=min_wavelength, max_wavelength=max_wavelength)
-        except:
+        except Exception:  # SMARTS failed for this timestamp; skip it
             if scale_albedo_nonspectral_sim:
                 walb[dt] = 0.0
             continue
@@ -412,6 +411,8 @@ def generate_spectral_tmys(wavelengths, spectra_folder, metdata, location_name,
         File path or path-like string pointing to the destination folder for spectral TMYs
     """
 
+    from tqdm import tqdm
+
     # -- read in the spectra files
     spectra_files = next(os.walk(spectra_folder))[2]
     spectra_files.sort()
@@ -501,6 +502,8 @@ def integrated_spectrum(spectra_folder, metdata ):
         list of integrated sums for DNI, DHI, DNI*ALB, DHI*ALB
     """
 
+    from scipy import integrate
+
     # -- read in the spectra files
     spectra_files = next(os.walk(spectra_folder))[2]
     spectra_files.sort()
@@ -525,11 +528,8 @@ def integrated_spectrum(spectra_folder, metdata ):
     temp = pd.read_csv(os.path.join(spectra_folder,spectra_files[0]), header=1, index_col = 0)
 
     # -- copy and reproduce the datetime index
-    dates = []
-    for file in spectra_files:
-        take = file[4:-4]
-        if take not in dates:
-            dates.append(take)
+    # dict.fromkeys keeps first-seen order without a list membership scan
+    dates = list(dict.fromkeys(file[4:-4] for file in spectra_files))
     dates = pd.to_datetime(dates,format='%y_%m_%d_%H_%M').tz_localize(dtindex.tz)
 
     # -- create a multi-index of columns [timeindex:alb,dni,dhi,ghi]
@@ -544,11 +544,15 @@ def integrated_spectrum(spectra_folder, metdata ):
         b = file[:3].upper()
         spectra_df[a,b] = pd.read_csv(os.path.join(spectra_folder,file),header=1, index_col=0)
     integrated_sums = pd.DataFrame(index=dates, columns=['Sum_DNI', 'Sum_DHI', 'Sum_DNI_ALB', 'Sum_DHI_ALB'])
-    for col in spectra_df.columns:
-        integrated_sums.loc[col[0], 'Sum_DNI'] = integrate.trapezoid(spectra_df[col[0], 'DNI'], spectra_df.index)
-        integrated_sums.loc[col[0], 'Sum_DHI'] = integrate.trapezoid(spectra_df[col[0], 'DHI'], spectra_df.index)
-        integrated_sums.loc[col[0], 'Sum_DNI_ALB'] = integrate.trapezoid(spectra_df[col[0], 'DNI'] * spectra_df[col[0], 'ALB'], spectra_df.index)
-        integrated_sums.loc[col[0], 'Sum_DHI_ALB'] = integrate.trapezoid(spectra_df[col[0], 'DHI'] * spectra_df[col[0], 'ALB'], spectra_df.index)
+    # one pass per timestamp (not per timestamp and irradiance column)
+    for date in dates:
+        dni = spectra_df[date, 'DNI']
+        dhi = spectra_df[date, 'DHI']
+        alb = spectra_df[date, 'ALB']
+        integrated_sums.loc[date, 'Sum_DNI'] = integrate.trapezoid(dni, spectra_df.index)
+        integrated_sums.loc[date, 'Sum_DHI'] = integrate.trapezoid(dhi, spectra_df.index)
+        integrated_sums.loc[date, 'Sum_DNI_ALB'] = integrate.trapezoid(dni * alb, spectra_df.index)
+        integrated_sums.loc[date, 'Sum_DHI_ALB'] = integrate.trapezoid(dhi * alb, spectra_df.index)
 
     return integrated_sums
     
@@ -760,4 +760,105 @@ def test_GH256_nomodule_error():
                                       sceneDict=sceneDict, cumulativesky=False)
     
 
-    
\ No newline at end of file
+    
+
+class _FakeEPWResponse:
+    # minimal stand-in for a requests.Response used by getEPW
+    def __init__(self, url, content=b'', fail_after=None):
+        self.url = url
+        self.ok = True
+        self.status_code = 200
+        self.content = content
+        self.fail_after = fail_after
+
+    def json(self):
+        return {'features': [{'properties': {'epw': '<a href="https://epw.test/USA_CO_Test.epw">'},
+                              'geometry': {'coordinates': [-105.25, 40.0]}}]}
+
+    def iter_content(self, chunk_size=1):
+        import requests
+        for i in range(0, len(self.content), chunk_size):
+            if self.fail_after is not None and i >= self.fail_after:
+                raise requests.exceptions.ChunkedEncodingError('connection dropped')
+            yield self.content[i:i+chunk_size]
+
+    def raise_for_status(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+
+def _fakeEPWSession(calls, content, fail_after=None):
+    # returns a requests.Session replacement that records every GET in calls
+    class _FakeSession:
+        def get(self, url, **kwargs):
+            calls.append(url)
+            return _FakeEPWResponse(url, content, fail_after)
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *args):
+            pass
+    return _FakeSession
+
+
+def test_getEPW_interrupted_download(monkeypatch, tmp_path):
+    # an interrupted download must not leave a partial EPW that is reused later
+    import requests
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(bifacial_radiance.main, '_EPW_INDEX_CACHE', {})
+    content = b'LOCATION,Test,CO,USA\n' * 10000
+    calls = []
+    demo = bifacial_radiance.RadianceObj('test_getEPW')
+    monkeypatch.setattr(requests, 'Session',
+                        _fakeEPWSession(calls, content, fail_after=64*1024))
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        demo.getEPW(lat=40.0, lon=-105.25)
+    assert os.listdir('EPWs') == []
+    # retry downloads the full file
+    monkeypatch.setattr(requests, 'Session', _fakeEPWSession(calls, content))
+    epwfile = demo.getEPW(lat=40.0, lon=-105.25)
+    assert epwfile == os.path.join('EPWs', 'USA_CO_Test.epw')
+    with open(epwfile, 'rb') as f:
+        assert f.read() == content
+    assert os.listdir('EPWs') == ['USA_CO_Test.epw']
+
+
+def test_getEPW_forceDownload(monkeypatch, tmp_path):
+    # a second call reuses the cached index and file; forceDownload re-fetches both
+    import requests
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(bifacial_radiance.main, '_EPW_INDEX_CACHE', {})
+    calls = []
+    demo = bifacial_radiance.RadianceObj('test_getEPW')
+    monkeypatch.setattr(requests, 'Session', _fakeEPWSession(calls, b'LOCATION,Test\n'))
+    epwfile = demo.getEPW(lat=40.0, lon=-105.25)
+    assert len(calls) == 2  # index + EPW file
+    calls.clear()
+    assert demo.getEPW(lat=40.0, lon=-105.25) == epwfile
+    assert calls == []
+    monkeypatch.setattr(requests, 'Session', _fakeEPWSession(calls, b'LOCATION,New\n'))
+    assert demo.getEPW(lat=40.0, lon=-105.25, forceDownload=True) == epwfile
+    assert len(calls) == 2
+    assert calls[0].endswith('master.geojson')
+    assert calls[1] == 'https://epw.test/USA_CO_Test.epw'
+    with open(epwfile, 'rb') as f:
+        assert f.read() == b'LOCATION,New\n'
+
+
+def test_gendaylit1axis_partial_overlap():
+    # trackerdict keys missing from metdata are skipped, not the rest of the day
+    demo = bifacial_radiance.RadianceObj('test_gendaylit1axis')
+    demo.setGround(0.2)
+    demo.readWeatherFile(MET_FILENAME, starttime='06_17_08', endtime='06_17_16')
+    trackerdict = demo.set1axis(cumulativesky=False)
+    metdata = demo.readWeatherFile(MET_FILENAME, starttime='06_17_12', endtime='06_17_16')
+    demo.set1axis(metdata=metdata, cumulativesky=False)
+    trackerdict2 = demo.gendaylit1axis(metdata=metdata, trackerdict=trackerdict)
+    assert len(trackerdict) > len(trackerdict2) > 0
+    assert set(trackerdict2) == {key for key in trackerdict if key[-4:] >= '1200'}
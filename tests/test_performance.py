@@ -73,4 +73,17 @@ def test_MBD():
     assert performance.MBD_abs(meas,model) == pytest.approx(0.111, abs=.01)
     assert performance.MBD_abs(meas,meas) == 0
     assert performance.RMSE_abs(meas,model) == pytest.approx(0.584, abs=.01)
-    assert performance.RMSE(meas,meas) == 0
\ No newline at end of file
+    assert performance.RMSE(meas,meas) == 0
+    # NaN entries are dropped and Series inputs are aligned on their index
+    meas_s = pd.Series(np.append(meas, np.nan))
+    model_s = pd.Series(np.append(model, 5.0))
+    assert performance.MBD(meas_s, model_s) == pytest.approx(2.174, abs=.01)
+    assert performance.RMSE(meas_s, model_s) == pytest.approx(11.435, abs=.01)
+    model_shuffled = model_s.sample(frac=1, random_state=0)
+    assert performance.MBD(meas_s, model_shuffled) == pytest.approx(2.174, abs=.01)
+    assert performance.RMSE_abs(meas_s, model_shuffled) == pytest.approx(0.584, abs=.01)
+    # nothing left after filtering
+    with pytest.raises(ZeroDivisionError):
+        performance.MBD(meas, meas - 20)
+    with pytest.raises(ZeroDivisionError):
+        performance.RMSE_abs(meas, np.full(10, np.nan))